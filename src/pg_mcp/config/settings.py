@@ -5,11 +5,18 @@ and type safety. Configuration is loaded from environment variables with
 sensible defaults.
 """
 
+import re
 from typing import Literal
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Character allow-lists for config-derived session SQL fragments
+# (search_path, readonly_role); shared by the executor and the pool so both
+# validate the same strings identically
+SEARCH_PATH_RE = re.compile(r"[A-Za-z0-9_, ]+")
+IDENTIFIER_RE = re.compile(r"[A-Za-z0-9_]+")
+
 
 class DatabaseConfig(BaseSettings):
     """PostgreSQL database connection configuration."""
@@ -31,6 +38,12 @@ class DatabaseConfig(BaseSettings):
     command_timeout: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Command execution timeout in seconds"
     )
+    statement_cache_size: int = Field(
+        default=256,
+        ge=0,
+        le=4096,
+        description="Per-connection prepared statement cache size (0 disables caching)",
+    )
 
     @property
     def dsn(self) -> str:
@@ -103,6 +116,21 @@ class SecurityConfig(BaseSettings):
     max_execution_time: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Maximum query execution time in seconds"
     )
+    explicit_transaction: bool = Field(
+        default=False,
+        description=(
+            "Wrap each query in an explicit read-only transaction "
+            "(adds BEGIN/COMMIT round-trips; useful for audit trails)"
+        ),
+    )
+    push_limit_into_sql: bool = Field(
+        default=True,
+        description="Wrap queries in a LIMIT subquery so row limiting happens in PostgreSQL",
+    )
+    count_total_rows: bool = Field(
+        default=False,
+        description="Issue a COUNT(*) subquery for the exact total when results are truncated",
+    )
     readonly_role: str | None = Field(
         default=None, description="PostgreSQL role to switch to for read-only access"
     )
@@ -184,6 +212,9 @@ class ResilienceConfig(BaseSettings):
     backoff_factor: float = Field(
         default=2.0, ge=1.0, le=10.0, description="Exponential backoff factor"
     )
+    retry_cap: float = Field(
+        default=30.0, ge=1.0, le=300.0, description="Maximum retry delay in seconds"
+    )
     circuit_breaker_threshold: int = Field(
         default=5, ge=1, le=100, description="Failures before circuit opens"
     )
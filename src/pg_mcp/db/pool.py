@@ -4,24 +4,46 @@ This module provides utilities for creating and managing asyncpg connection
 pools for PostgreSQL databases.
 """
 
+from typing import TYPE_CHECKING
+
 import asyncpg
-from asyncpg import Pool
+from asyncpg import Connection, Pool
+
+from pg_mcp.config.settings import (
+    IDENTIFIER_RE,
+    SEARCH_PATH_RE,
+    DatabaseConfig,
+    SecurityConfig,
+)
 
-from pg_mcp.config.settings import DatabaseConfig
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
 
 
-async def create_pool(config: DatabaseConfig) -> Pool:
+async def create_pool(
+    config: DatabaseConfig,
+    security_config: SecurityConfig | None = None,
+) -> Pool:
     """Create a connection pool for a single database.
 
+    When a security configuration is provided, the static session parameters
+    (``search_path`` and the read-only role) are pinned once per physical
+    connection instead of being re-sent on every query: ``search_path`` goes
+    into ``server_settings`` (applied during connection startup) and ``SET
+    ROLE`` runs in the pool's ``init`` callback.
+
     Args:
         config: Database configuration containing connection parameters
             and pool settings.
+        security_config: Optional security configuration whose search_path
+            and readonly_role are pinned at connection-setup time.
 
     Returns:
         Pool: An asyncpg connection pool instance.
 
     Raises:
         asyncpg.PostgresError: If connection to the database fails.
+        ValueError: If security_config contains an unsafe search_path or role.
 
     Example:
         >>> config = DatabaseConfig(host="localhost", name="mydb")
@@ -29,6 +51,40 @@ async def create_pool(config: DatabaseConfig) -> Pool:
         >>> async with pool.acquire() as conn:
         ...     result = await conn.fetch("SELECT 1")
     """
+    server_settings: dict[str, str] | None = None
+    init: Callable[[Connection], Awaitable[None]] | None = None
+
+    if security_config is not None:
+        search_path = security_config.safe_search_path
+        if SEARCH_PATH_RE.fullmatch(search_path) is None:
+            raise ValueError(f"Invalid search_path configuration: {search_path!r}")
+        # default_transaction_read_only makes PostgreSQL's implicit
+        # per-statement transactions read-only, so the executor can skip the
+        # explicit BEGIN/COMMIT round-trips per query
+        server_settings = {
+            "search_path": search_path,
+            "default_transaction_read_only": "on",
+        }
+
+        if security_config.readonly_role:
+            readonly_role = security_config.readonly_role
+            if IDENTIFIER_RE.fullmatch(readonly_role) is None:
+                raise ValueError(f"Invalid readonly_role configuration: {readonly_role!r}")
+
+            async def _set_role(conn: Connection) -> None:
+                await conn.execute(f"SET ROLE {readonly_role}")
+
+            init = _set_role
+
+    # A non-zero statement_cache_size is required for SQLExecutor's statement
+    # reuse: connection.fetch() consults this per-connection cache, so repeated
+    # queries skip the Parse step on warm connections.
+    #
+    # Row decoding relies on asyncpg's built-in C codecs, which use the binary
+    # wire format for numeric, timestamp and friends — substantially cheaper
+    # than text parsing on numeric-heavy result sets. Do not register custom
+    # Python codecs for these types here (e.g. via set_type_codec): that would
+    # replace the C binary path with a per-value Python call.
     pool = await asyncpg.create_pool(
         host=config.host,
         port=config.port,
@@ -39,6 +95,9 @@ async def create_pool(config: DatabaseConfig) -> Pool:
         max_size=config.max_pool_size,
         timeout=config.pool_timeout,
         command_timeout=config.command_timeout,
+        statement_cache_size=config.statement_cache_size,
+        server_settings=server_settings,
+        init=init,
     )
 
     if pool is None:
@@ -47,7 +106,10 @@ async def create_pool(config: DatabaseConfig) -> Pool:
     return pool
 
 
-async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
+async def create_pools(
+    configs: list[DatabaseConfig],
+    security_config: SecurityConfig | None = None,
+) -> dict[str, Pool]:
     """Create connection pools for multiple databases.
 
     This function creates pools concurrently for all provided database
@@ -55,6 +117,8 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
 
     Args:
         configs: List of database configurations.
+        security_config: Optional security configuration applied to every pool
+            (see :func:`create_pool`).
 
     Returns:
         dict[str, Pool]: Dictionary mapping database names to their pools.
@@ -73,7 +137,7 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
     pools: dict[str, Pool] = {}
 
     for config in configs:
-        pool = await create_pool(config)
+        pool = await create_pool(config, security_config)
         pools[config.name] = pool
 
     return pools
@@ -98,7 +98,9 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         logger.info("Creating database connection pools...")
         _pools = {}
         # Note: For single database configuration, we use the main database config
-        pool = await create_pool(_settings.database)
+        # Pin static session parameters (search_path, read-only role) at
+        # connection-setup time so they are not re-sent on every query
+        pool = await create_pool(_settings.database, security_config=_settings.security)
         _pools[_settings.database.name] = pool
         logger.info(
             f"Created connection pool for database '{_settings.database.name}'",
@@ -165,6 +167,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
                 security_config=_settings.security,
                 db_config=_settings.database,
                 resilience_config=_settings.resilience,
+                session_pinned=True,  # pools above pin search_path/role per connection
             )
             sql_executors[db_name] = executor
             logger.info(f"Created SQL executor for database '{db_name}'")
@@ -0,0 +1,167 @@
+"""Row serialization hot loops, isolated for optional compilation.
+
+This module holds the per-row/per-cell kernels that dominate CPU time when
+shaping large result sets. They are deliberately flat module-level functions
+with no closures, ``self`` access, or module-global mutation, so the file
+compiles unmodified with mypyc or Cython's pure-Python mode (mirroring
+asyncpg's own compiled-core design). When a compiled variant has been built
+as ``pg_mcp.services._serialize_c``, it transparently replaces the
+interpreter implementations at import time; environments without a build
+toolchain simply run the pure-Python fallbacks below.
+"""
+
+import contextlib
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+def identity(value: Any) -> Any:
+    """Return the value unchanged (JSON-native columns)."""
+    return value
+
+
+def json_default(obj: Any) -> Any:
+    """Convert a non-JSON-native value for the C encoder loop.
+
+    Passed as ``default=`` to ``json.dumps`` so nested containers are
+    flattened by the C encoder instead of per-element Python recursion.
+
+    Args:
+        obj: Value the encoder cannot serialize natively.
+
+    Returns:
+        A JSON-native replacement value.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, datetime.timedelta):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.hex()
+    # Last resort for exotic types (ranges, composites): string form
+    return str(obj)
+
+
+def serialize_value(value: Any) -> Any:
+    """Serialize a single value to a JSON-compatible type.
+
+    Args:
+        value: Value to serialize.
+
+    Returns:
+        Serialized value that is JSON-compatible.
+    """
+    # Handle None
+    if value is None:
+        return None
+
+    # Handle datetime types
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    # Handle timedelta
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+
+    # Handle Decimal (convert to float)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    # Handle UUID
+    if isinstance(value, uuid.UUID):
+        return str(value)
+
+    # Handle bytes (convert to hex string)
+    if isinstance(value, bytes):
+        return value.hex()
+
+    # Handle nested containers via the C json encode/decode loop: for deeply
+    # nested jsonb/array values this beats per-element Python call frames
+    if isinstance(value, (list, tuple, dict)):
+        return json.loads(json.dumps(value, default=json_default))
+
+    # Return other types as-is (str, int, float, bool, etc.)
+    return value
+
+
+def serialize_rows(
+    records: Sequence[Any],
+    keys: list[str],
+    col_serializers: list[Callable[[Any], Any]] | None,
+) -> list[dict[str, Any]]:
+    """Build serialized row dictionaries from records in one fused pass.
+
+    Args:
+        records: Non-empty sequence of asyncpg Records (or mappings).
+        keys: Column names shared by every record.
+        col_serializers: Optional per-column serializer functions; None
+            selects the generic per-cell cascade.
+
+    Returns:
+        list: Row dictionaries with all values JSON-compatible.
+    """
+    if col_serializers is not None:
+        # Common fast path: every column is JSON-native, so rows can be
+        # built with C-level zip+dict and zero per-cell Python work
+        if all(fn is identity for fn in col_serializers):
+            return [dict(zip(keys, row.values(), strict=True)) for row in records]
+
+        return [
+            {
+                key: fn(value)
+                for key, fn, value in zip(keys, col_serializers, row.values(), strict=True)
+            }
+            for row in records
+        ]
+
+    return [
+        {key: serialize_value(value) for key, value in zip(keys, row.values(), strict=True)}
+        for row in records
+    ]
+
+
+def columnar_rows(
+    records: Sequence[Any],
+    col_serializers: list[Callable[[Any], Any]] | None,
+) -> list[list[Any]]:
+    """Build serialized row arrays from records.
+
+    Args:
+        records: Non-empty sequence of asyncpg Records (or mappings).
+        col_serializers: Optional per-column serializer functions; None
+            selects the generic per-cell cascade.
+
+    Returns:
+        list: One plain list of serialized values per row.
+    """
+    if col_serializers is not None:
+        if all(fn is identity for fn in col_serializers):
+            return [list(row.values()) for row in records]
+        return [
+            [fn(value) for fn, value in zip(col_serializers, row.values(), strict=True)]
+            for row in records
+        ]
+
+    return [[serialize_value(value) for value in row.values()] for row in records]
+
+
+with contextlib.suppress(ImportError):  # pragma: no cover - optional build artifact
+    # The compiled kernels must replace the whole set, including the
+    # ``identity`` sentinel: a compiled serialize_rows compares
+    # ``fn is identity`` against its own binding, so callers building
+    # dispatch lists have to see that same object
+    from pg_mcp.services._serialize_c import (  # type: ignore[import-not-found,no-redef]  # noqa: F401
+        columnar_rows,
+        identity,
+        json_default,
+        serialize_rows,
+        serialize_value,
+    )
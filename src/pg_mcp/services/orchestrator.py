@@ -211,7 +211,10 @@ class QueryOrchestrator:
                 extra={
                     "request_id": request_id,
                     "database": database_name,
-                    "row_count": total_count,
+                    "row_count": len(results),
+                    # Lower bound when the pushed-down LIMIT truncated the
+                    # result and count_total_rows is disabled
+                    "total_row_count": total_count,
                     "execution_time_ms": execution_time_ms,
                 },
             )
@@ -5,33 +5,145 @@ result serialization, row limiting, and retry logic for transient errors.
 """
 
 import asyncio
-import datetime
-import decimal
+import base64
 import logging
-import uuid
-from typing import Any
+import random
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, Literal, TypeVar
 
 import asyncpg
 from asyncpg import Connection, Pool
 
-from pg_mcp.config.settings import DatabaseConfig, ResilienceConfig, SecurityConfig
+from pg_mcp.config.settings import (
+    IDENTIFIER_RE as _IDENTIFIER_RE,
+)
+from pg_mcp.config.settings import (
+    SEARCH_PATH_RE as _SEARCH_PATH_RE,
+)
+from pg_mcp.config.settings import (
+    DatabaseConfig,
+    ResilienceConfig,
+    SecurityConfig,
+)
 from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
 
+# The row/cell hot loops live in a compilation-friendly module that swaps in
+# a compiled variant when one has been built (see services._serialize)
+from pg_mcp.services._serialize import columnar_rows as _columnar_rows
+from pg_mcp.services._serialize import identity as _identity
+from pg_mcp.services._serialize import serialize_rows as _serialize_rows
+from pg_mcp.services._serialize import serialize_value as _serialize_value
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Optional C JSON encoders: when the downstream response encoder is one of
+# these, datetime/UUID values can pass through serialization untouched
+try:  # pragma: no cover - depends on installed extras
+    import orjson  # noqa: F401
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:  # pragma: no cover - depends on installed extras
+    import msgspec  # noqa: F401
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+EncoderMode = Literal["json_stdlib", "orjson", "msgspec"]
+
 # Transient PostgreSQL error codes that warrant retry
-RETRYABLE_ERROR_CODES = {
-    "08000",  # Connection exception
-    "08003",  # Connection does not exist
-    "08006",  # Connection failure
-    "08001",  # SQL client unable to establish connection
-    "08004",  # Server rejected connection
-    "40001",  # Serialization failure
-    "40P01",  # Deadlock detected
-    "53300",  # Too many connections
-    "57P01",  # Admin shutdown
-    "57P02",  # Crash shutdown
-    "57P03",  # Cannot connect now
+RETRYABLE_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "08000",  # Connection exception
+        "08003",  # Connection does not exist
+        "08006",  # Connection failure
+        "08001",  # SQL client unable to establish connection
+        "08004",  # Server rejected connection
+        "40001",  # Serialization failure
+        "40P01",  # Deadlock detected
+        "53300",  # Too many connections
+        "57P01",  # Admin shutdown
+        "57P02",  # Crash shutdown
+        "57P03",  # Cannot connect now
+    }
+)
+
+# Maximum entries in the executor-level serializer-dispatch LRU
+_SERIALIZER_CACHE_SIZE = 500
+
+# Statements that are valid as a subquery and therefore safe to wrap in the
+# row-limiting subselect; anything else (e.g. EXPLAIN) must run unwrapped
+_WRAPPABLE_SQL_RE = re.compile(r"\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+def _isoformat(value: Any) -> Any:
+    """Serialize a datetime/date/time column value to an ISO string."""
+    return None if value is None else value.isoformat()
+
+
+def _interval_to_str(value: Any) -> Any:
+    """Serialize an interval column value to its string form."""
+    return None if value is None else str(value)
+
+
+def _numeric_to_float(value: Any) -> Any:
+    """Serialize a numeric column value to float."""
+    return None if value is None else float(value)
+
+
+def _uuid_to_str(value: Any) -> Any:
+    """Serialize a uuid column value to its canonical dashed string."""
+    return None if value is None else str(value)
+
+
+def _uuid_to_hex(value: Any) -> Any:
+    """Serialize a uuid column value to its 32-character dashless hex string.
+
+    Reading the precomputed ``hex`` attribute skips the Python-level dash
+    formatting that ``str(uuid)`` performs on every value.
+    """
+    return None if value is None else value.hex
+
+
+def _bytea_to_hex(value: Any) -> Any:
+    """Serialize a bytea column value to a hexadecimal string."""
+    return None if value is None else value.hex()
+
+
+def _bytea_to_base64(value: Any) -> Any:
+    """Serialize a bytea column value to a base64 string.
+
+    Base64 expands payloads ~1.33x versus hex's 2x, so bytea-heavy result
+    sets shrink by a third on the wire.
+    """
+    return None if value is None else base64.b64encode(value).decode("ascii")
+
+
+# PostgreSQL types whose decoded Python values are already JSON-native
+_JSON_NATIVE_TYPES = frozenset(
+    {"bool", "int2", "int4", "int8", "float4", "float8", "oid", "text", "varchar", "bpchar", "name"}
+)
+
+# Flat per-column converters keyed by PostgreSQL type name; anything absent
+# falls back to the recursive generic serializer
+_COLUMN_SERIALIZERS: dict[str, Callable[[Any], Any]] = {
+    "timestamp": _isoformat,
+    "timestamptz": _isoformat,
+    "date": _isoformat,
+    "time": _isoformat,
+    "timetz": _isoformat,
+    "interval": _interval_to_str,
+    "numeric": _numeric_to_float,
+    "uuid": _uuid_to_str,
+    "bytea": _bytea_to_hex,
 }
 
 
@@ -57,6 +169,12 @@ class SQLExecutor:
         security_config: SecurityConfig,
         db_config: DatabaseConfig,
         resilience_config: ResilienceConfig | None = None,
+        *,
+        session_pinned: bool = False,
+        encoder_mode: EncoderMode = "json_stdlib",
+        uuid_format: Literal["dashed", "hex"] = "dashed",
+        bytes_encoding: Literal["hex", "base64", "raw"] = "hex",
+        serialize_in_thread_threshold: int = 10_000,
     ) -> None:
         """Initialize SQL executor.
 
@@ -65,21 +183,127 @@ class SQLExecutor:
             security_config: Security configuration including timeouts and limits.
             db_config: Database configuration including connection parameters.
             resilience_config: Optional resilience config for retry behavior.
+            session_pinned: Set to True when the pool was created with the
+                security config (see db.pool.create_pool), meaning search_path
+                and the read-only role are already pinned per connection. Only
+                the statement timeout is then sent per query, saving two
+                round-trips.
+            encoder_mode: JSON encoder the caller feeds the results to.
+                ``orjson`` and ``msgspec`` serialize datetime and UUID objects
+                natively in C, so those values are passed through untouched
+                instead of being converted per cell in Python. Decimal and
+                bytea conversion is kept in all modes.
+            uuid_format: String form for uuid columns. The default ``dashed``
+                is the canonical ``str(uuid)`` form; ``hex`` returns the
+                32-character dashless form via the UUID's precomputed ``hex``
+                attribute, which is noticeably cheaper on result sets of UUID
+                primary keys. API consumers opting in must accept the format
+                change. Ignored in C encoder modes, which emit UUID objects
+                directly.
+            bytes_encoding: Wire encoding for bytea columns. The default
+                ``hex`` keeps the existing 2x-size hexadecimal string;
+                ``base64`` cuts the payload to ~1.33x the raw size on
+                bytea-heavy result sets; ``raw`` passes bytes objects through
+                for downstream encoders with native binary support (e.g.
+                msgspec's msgpack). The chosen encoding is part of the API
+                contract per deployment.
+            serialize_in_thread_threshold: Row count above which the
+                serialization pass runs in a worker thread via
+                ``asyncio.to_thread`` so it does not block the event loop.
+                The GIL still applies, but I/O-bound coroutines keep running
+                during the pass.
+
+        Raises:
+            DatabaseError: If the configuration is invalid or the requested
+                encoder library is not installed.
         """
         self.pool = pool
         self.security_config = security_config
         self.db_config = db_config
         self.resilience_config = resilience_config
+        self.session_pinned = session_pinned
+
+        # Validate the config-derived session SQL once and cache the final
+        # statements: both strings come from configuration and never change
+        # per call, so re-scanning them on every query is wasted work.
+        # Misconfiguration surfaces here, at construction time.
+        self._search_path_sql: str | None = None
+        self._role_sql: str | None = None
+        self._readonly_sql: str | None = None
+        if not session_pinned:
+            # Pools created without the security config do not pin
+            # default_transaction_read_only, so enforce it here: it rides in
+            # the already-batched session round-trip and keeps every implicit
+            # per-statement transaction read-only regardless of pool wiring
+            self._readonly_sql = "SET default_transaction_read_only = on"
+            search_path = security_config.safe_search_path
+            if _SEARCH_PATH_RE.fullmatch(search_path) is None:
+                raise DatabaseError(
+                    message="Invalid search_path configuration",
+                    details={"search_path": search_path},
+                )
+            self._search_path_sql = f"SET search_path = '{search_path}'"
+
+            if security_config.readonly_role:
+                readonly_role = security_config.readonly_role
+                if _IDENTIFIER_RE.fullmatch(readonly_role) is None:
+                    raise DatabaseError(
+                        message="Invalid readonly_role configuration",
+                        details={"readonly_role": readonly_role},
+                    )
+                self._role_sql = f"SET ROLE {readonly_role}"
+
+        # Per-instance serializer table: encoder-aware modes pass datetime and
+        # UUID objects through so the downstream C encoder handles them
+        if encoder_mode == "orjson" and not _HAS_ORJSON:
+            raise DatabaseError(
+                message="encoder_mode 'orjson' requires the orjson package",
+                details={"encoder_mode": encoder_mode},
+            )
+        if encoder_mode == "msgspec" and not _HAS_MSGSPEC:
+            raise DatabaseError(
+                message="encoder_mode 'msgspec' requires the msgspec package",
+                details={"encoder_mode": encoder_mode},
+            )
+        self.encoder_mode = encoder_mode
+        self.uuid_format = uuid_format
+        self.serialize_in_thread_threshold = serialize_in_thread_threshold
+        self._column_serializers = dict(_COLUMN_SERIALIZERS)
+        if encoder_mode != "json_stdlib":
+            for type_name in ("timestamp", "timestamptz", "date", "time", "timetz", "uuid"):
+                self._column_serializers[type_name] = _identity
+        elif uuid_format == "hex":
+            self._column_serializers["uuid"] = _uuid_to_hex
+        self.bytes_encoding = bytes_encoding
+        if bytes_encoding == "base64":
+            self._column_serializers["bytea"] = _bytea_to_base64
+        elif bytes_encoding == "raw":
+            self._column_serializers["bytea"] = _identity
+
+        # Combine the static statements so they ride in the same simple-query
+        # message as the per-query timeout (one round-trip instead of three)
+        static_parts = [
+            s for s in (self._search_path_sql, self._role_sql, self._readonly_sql) if s is not None
+        ]
+        self._static_session_sql: str | None = "; ".join(static_parts) if static_parts else None
+        # Combined session SQL memoized per statement_timeout value (in ms)
+        self._timeout_stmt_cache: dict[int, str] = {}
+        # Executor-level LRU of per-column serializer lists keyed by statement
+        # text (see _statement_serializers); None marks statements without
+        # column type metadata
+        self._serializer_cache: OrderedDict[str, list[Callable[[Any], Any]] | None] = OrderedDict()
 
         # Retry configuration with defaults
         if resilience_config:
             self.max_retries = resilience_config.max_retries
             self.retry_delay = resilience_config.retry_delay
             self.backoff_factor = resilience_config.backoff_factor
+            self.retry_cap = resilience_config.retry_cap
         else:
             self.max_retries = 3
             self.retry_delay = 1.0
             self.backoff_factor = 2.0
+            self.retry_cap = 30.0
 
     async def execute(
         self,
@@ -91,7 +315,9 @@ class SQLExecutor:
 
         This method:
         1. Acquires a connection from the pool
-        2. Starts a read-only transaction
+        2. Relies on the session's read-only default transaction mode
+           (an explicit transaction is opened only when
+           ``SecurityConfig.explicit_transaction`` is set)
         3. Sets session parameters (timeout, search_path, role)
         4. Executes the query with timeout
         5. Retries on transient errors with exponential backoff
@@ -106,7 +332,11 @@ class SQLExecutor:
         Returns:
             tuple: (results, total_row_count) where:
                 - results: List of row dictionaries with serialized values
-                - total_row_count: Total number of rows (before limiting)
+                - total_row_count: Number of rows the query produced. When
+                  ``push_limit_into_sql`` is enabled (the default) and the
+                  result was truncated, this is a lower bound capped at
+                  ``max_rows + 1``; set ``count_total_rows`` for the exact
+                  total via an extra COUNT(*) query.
 
         Raises:
             ExecutionTimeoutError: If query execution exceeds timeout.
@@ -118,32 +348,100 @@ class SQLExecutor:
             ...     timeout=10.0,
             ...     max_rows=1000
             ... )
-            >>> print(f"Retrieved {len(results)} of {count} total rows")
+            >>> truncated = count > len(results)
+            >>> print(f"Retrieved {len(results)} rows (truncated: {truncated})")
         """
         # Use configured defaults if not specified
-        timeout = timeout or self.security_config.max_execution_time
-        max_rows = max_rows or self.security_config.max_rows
+        run_timeout = timeout or self.security_config.max_execution_time
+        run_max_rows = max_rows or self.security_config.max_rows
+
+        return await self._with_retry(
+            sql, lambda: self._execute_once(sql, run_timeout, run_max_rows)
+        )
+
+    async def execute_columnar(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+        max_rows: int | None = None,
+    ) -> tuple[list[str], list[list[Any]], int]:
+        """Execute SQL query returning a columnar result shape.
+
+        Applies the same security measures and retry logic as
+        :meth:`execute`, but returns column names once plus plain row arrays
+        instead of a list of dicts. For JSON-bound callers this halves the
+        payload and peak memory, since the string keys are not repeated for
+        every row.
 
+        Args:
+            sql: SQL query to execute (should already be validated).
+            timeout: Query timeout in seconds (uses config default if None).
+            max_rows: Maximum rows to return (uses config default if None).
+
+        Returns:
+            tuple: (columns, rows, total_row_count) where:
+                - columns: Ordered list of column names
+                - rows: List of row value arrays with serialized values
+                - total_row_count: Total number of rows (before limiting)
+
+        Raises:
+            ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseError: If database operation fails after all retries.
+
+        Example:
+            >>> columns, rows, count = await executor.execute_columnar(
+            ...     "SELECT id, name FROM users"
+            ... )
+            >>> columns  # ["id", "name"]
+            >>> rows[0]  # [1, "Alice"]
+        """
+        run_timeout = timeout or self.security_config.max_execution_time
+        run_max_rows = max_rows or self.security_config.max_rows
+
+        return await self._with_retry(
+            sql, lambda: self._execute_once_columnar(sql, run_timeout, run_max_rows)
+        )
+
+    async def _with_retry(self, sql: str, run: Callable[[], Awaitable[T]]) -> T:
+        """Run a query coroutine with retry on transient database errors.
+
+        Args:
+            sql: SQL being executed (for error details only).
+            run: Zero-argument callable producing the query coroutine.
+
+        Returns:
+            Whatever the query coroutine returns.
+
+        Raises:
+            ExecutionTimeoutError: Propagated without retry.
+            DatabaseError: If the operation fails after all retries.
+        """
         last_error: Exception | None = None
         delay = self.retry_delay
 
         for attempt in range(self.max_retries + 1):
             try:
-                return await self._execute_once(sql, timeout, max_rows)
+                return await run()
             except ExecutionTimeoutError:
                 # Don't retry timeouts
                 raise
             except asyncpg.PostgresError as e:
-                # Check if this is a retryable error
-                error_code = getattr(e, "sqlstate", None)
+                # Check if this is a retryable error; sqlstate is defined on
+                # PostgresError itself (None by default), so direct access is safe
+                error_code = e.sqlstate
                 if error_code in RETRYABLE_ERROR_CODES and attempt < self.max_retries:
                     logger.warning(
-                        f"Retryable database error (attempt {attempt + 1}/{self.max_retries + 1}): {e}",
+                        f"Retryable database error "
+                        f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}",
                         extra={"error_code": error_code, "retry_delay": delay},
                     )
                     last_error = e
-                    await asyncio.sleep(delay)
-                    delay *= self.backoff_factor
+                    # Full-jitter backoff: sleeping a random fraction of the
+                    # window spreads retries out so coroutines hitting the same
+                    # cluster-wide failure (40001, 53300) don't re-stampede the
+                    # database in lockstep
+                    await asyncio.sleep(random.uniform(0, delay))  # noqa: S311
+                    delay = min(delay * self.backoff_factor, self.retry_cap)
                     continue
                 # Not retryable or out of retries
                 raise DatabaseError(
@@ -168,11 +466,41 @@ class SQLExecutor:
         # Should not reach here, but handle just in case
         if last_error:
             raise DatabaseError(
-                message=f"Database query failed after {self.max_retries + 1} attempts: {last_error!s}",
+                message=(
+                    f"Database query failed after {self.max_retries + 1} attempts: {last_error!s}"
+                ),
                 details={"attempts": self.max_retries + 1},
             ) from last_error
         raise DatabaseError(message="Query execution failed unexpectedly")
 
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["ExecutorSession"]:
+        """Hold one pooled connection for a series of sequential queries.
+
+        ``pool.acquire()`` has measurable bookkeeping overhead per call; for
+        trusted callers that issue several queries back to back, holding a
+        single connection for the duration avoids the repeated acquire/release
+        cycle and its per-acquire reset cost.
+
+        Note that queries issued through the session are not retried: a
+        transient failure typically invalidates the held connection, so the
+        caller should open a fresh session instead.
+        ``SecurityConfig.explicit_transaction`` is likewise not applied on
+        this path — session queries rely on the connection's read-only
+        session defaults rather than per-query BEGIN/COMMIT wrapping.
+
+        Yields:
+            ExecutorSession: A handle whose ``execute`` reuses the held
+                connection.
+
+        Example:
+            >>> async with executor.session() as s:
+            ...     users, _ = await s.execute("SELECT * FROM users")
+            ...     orders, _ = await s.execute("SELECT * FROM orders")
+        """
+        async with self.pool.acquire() as connection:
+            yield ExecutorSession(self, connection)
+
     async def _execute_once(
         self,
         sql: str,
@@ -188,28 +516,153 @@ class SQLExecutor:
 
         Returns:
             tuple: (results, total_row_count)
+
+        Note:
+            When ``push_limit_into_sql`` is enabled, at most ``max_rows + 1``
+            rows cross the wire; a truncated result then reports the fetched
+            row count as a lower bound for the total, unless
+            ``count_total_rows`` requests an exact COUNT(*).
         """
-        async with (
-            self.pool.acquire() as connection,
-            connection.transaction(readonly=True),
-        ):
-            # Set session parameters for security
-            await self._set_session_params(connection, timeout)
-
-            # Execute query with timeout
-            try:
-                records = await asyncio.wait_for(
-                    connection.fetch(sql),
-                    timeout=timeout,
+        # Push the row limit into PostgreSQL so large result sets are cut off
+        # server-side instead of streaming every row through the decoder. The
+        # extra sentinel row lets us detect truncation without a count query.
+        push_limit = self.security_config.push_limit_into_sql
+        fetch_sql = self._wrap_with_limit(sql, max_rows) if push_limit else sql
+
+        async with self.pool.acquire() as connection:
+            # PostgreSQL wraps each simple query in an implicit transaction
+            # using the session's default mode, which the pool pins to
+            # read-only (default_transaction_read_only=on). The explicit
+            # BEGIN/COMMIT pair is only worth its two round-trips when an
+            # audit trail demands it.
+            transaction = (
+                connection.transaction(readonly=True)
+                if self.security_config.explicit_transaction
+                else nullcontext()
+            )
+            async with transaction:
+                records, col_serializers, total_count = await self._fetch_on_connection(
+                    connection, sql, fetch_sql, timeout, max_rows
+                )
+
+        # Serialize after the connection is back in the pool: the pass is pure
+        # Python CPU work and asyncpg records own their decoded values, so
+        # holding the connection across it would only cut pool throughput.
+        # Above the threshold the pass moves to a worker thread so sibling
+        # coroutines are not stalled for its full duration.
+        if len(records) > self.serialize_in_thread_threshold:
+            results = await asyncio.to_thread(
+                self._serialize_results_guarded, records, col_serializers, fetch_sql
+            )
+        else:
+            results = self._serialize_results_guarded(records, col_serializers, fetch_sql)
+        return results, total_count
+
+    async def _execute_once_columnar(
+        self,
+        sql: str,
+        timeout: float,  # noqa: ASYNC109
+        max_rows: int,
+    ) -> tuple[list[str], list[list[Any]], int]:
+        """Execute SQL query once, shaping the result as columns plus rows.
+
+        Args:
+            sql: SQL query to execute.
+            timeout: Query timeout in seconds.
+            max_rows: Maximum rows to return.
+
+        Returns:
+            tuple: (columns, rows, total_row_count)
+        """
+        push_limit = self.security_config.push_limit_into_sql
+        fetch_sql = self._wrap_with_limit(sql, max_rows) if push_limit else sql
+
+        async with self.pool.acquire() as connection:
+            transaction = (
+                connection.transaction(readonly=True)
+                if self.security_config.explicit_transaction
+                else nullcontext()
+            )
+            async with transaction:
+                records, col_serializers, total_count = await self._fetch_on_connection(
+                    connection, sql, fetch_sql, timeout, max_rows
                 )
-            except TimeoutError as e:
-                raise ExecutionTimeoutError(
-                    message=f"Query execution exceeded timeout of {timeout} seconds",
-                    details={
-                        "timeout_seconds": timeout,
-                        "sql": sql[:200],
-                    },
-                ) from e
+
+        # Shape and serialize after the connection is released (see
+        # _execute_once)
+        if len(records) > self.serialize_in_thread_threshold:
+            columns, rows = await asyncio.to_thread(
+                self._columnar_results_guarded, records, col_serializers, fetch_sql
+            )
+        else:
+            columns, rows = self._columnar_results_guarded(records, col_serializers, fetch_sql)
+        return columns, rows, total_count
+
+    async def _run_query(
+        self,
+        connection: Connection,
+        sql: str,
+        fetch_sql: str,
+        timeout: float,  # noqa: ASYNC109
+        max_rows: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Run a single query on an already-acquired connection.
+
+        Args:
+            connection: Connection to execute on.
+            sql: Original validated SQL (used for count queries and errors).
+            fetch_sql: SQL to actually fetch (possibly limit-wrapped).
+            timeout: Query timeout in seconds.
+            max_rows: Maximum rows to return.
+
+        Returns:
+            tuple: (results, total_row_count)
+        """
+        records, col_serializers, total_count = await self._fetch_on_connection(
+            connection, sql, fetch_sql, timeout, max_rows
+        )
+
+        # Serialize special PostgreSQL types, building the row dicts in a
+        # single pass directly from the records
+        results = self._serialize_results_guarded(records, col_serializers, fetch_sql)
+
+        return results, total_count
+
+    async def _fetch_on_connection(
+        self,
+        connection: Connection,
+        sql: str,
+        fetch_sql: str,
+        timeout: float,  # noqa: ASYNC109
+        max_rows: int,
+    ) -> tuple[Sequence[Any], list[Callable[[Any], Any]] | None, int]:
+        """Fetch records for a query on an already-acquired connection.
+
+        Args:
+            connection: Connection to execute on.
+            sql: Original validated SQL (used for count queries and errors).
+            fetch_sql: SQL to actually fetch (possibly limit-wrapped).
+            timeout: Query timeout in seconds.
+            max_rows: Maximum rows to return.
+
+        Returns:
+            tuple: (records, col_serializers, total_row_count)
+        """
+        # Set session parameters for security
+        await self._set_session_params(connection, timeout)
+
+        # connection.fetch goes through asyncpg's per-connection prepared
+        # statement LRU (sized by DatabaseConfig.statement_cache_size), so
+        # repeated queries skip the Parse/Describe round-trip and server-side
+        # re-planning on warm connections. An explicit prepare() here would
+        # bypass that cache and re-plan on every call, so the statement is
+        # only described separately on a serializer-cache miss.
+        # asyncpg's native timeout uses the protocol's built-in cancel path,
+        # avoiding the extra Task and timer handle that asyncio.wait_for
+        # schedules on every call.
+        try:
+            records = await connection.fetch(fetch_sql, timeout=timeout)
+            col_serializers = await self._statement_serializers(connection, fetch_sql, timeout)
 
             # Track total count before limiting
             total_count = len(records)
@@ -217,14 +670,168 @@ class SQLExecutor:
             # Limit number of returned rows
             if len(records) > max_rows:
                 records = records[:max_rows]
+                if fetch_sql is not sql and self.security_config.count_total_rows:
+                    # The newline guards against a trailing line comment in
+                    # the original statement (see _wrap_with_limit)
+                    count_sql = (
+                        f"SELECT count(*) FROM ({sql.strip().rstrip(';')}\n)"  # noqa: S608
+                        " AS __pgmcp_count"
+                    )
+                    total_count = await connection.fetchval(count_sql, timeout=timeout)
+        except TimeoutError as e:
+            raise ExecutionTimeoutError(
+                message=f"Query execution exceeded timeout of {timeout} seconds",
+                details={
+                    "timeout_seconds": timeout,
+                    "sql": sql[:200],
+                },
+            ) from e
+
+        return records, col_serializers, total_count
+
+    async def _statement_serializers(
+        self,
+        connection: Connection,
+        fetch_sql: str,
+        timeout: float,  # noqa: ASYNC109
+    ) -> list[Callable[[Any], Any]] | None:
+        """Get the per-column serializer list for a statement.
+
+        The list is cached at the executor level keyed by statement text, so
+        the Describe round-trip needed for column type metadata happens once
+        per statement rather than per execution; the regular fetch path keeps
+        going through asyncpg's per-connection statement cache untouched.
+        The cache is a bounded LRU shared across pool connections.
 
-            # Convert asyncpg.Record to dict
-            results = [dict(record) for record in records]
+        A schema change (e.g. ``ALTER TABLE ... TYPE``) is not detected
+        here — that would require re-describing the statement on every call,
+        defeating the cache. Instead, a stale converter's failure during
+        serialization evicts the entry (see ``_serialize_results_guarded``)
+        and the next execution rebuilds it from fresh metadata.
+
+        Args:
+            connection: Connection used to describe the statement on a miss.
+            fetch_sql: Statement text used as the cache key (already
+                validated and, if applicable, limit-wrapped).
+            timeout: Timeout in seconds for the describing prepare.
+
+        Returns:
+            Per-column serializer list, or None when no type metadata is
+            available (e.g. test doubles) and the generic path should be used.
+        """
+        cache = self._serializer_cache
+        if fetch_sql in cache:
+            cache.move_to_end(fetch_sql)
+            return cache[fetch_sql]
+
+        # Miss: describe the statement once to learn the column types. This
+        # explicit prepare() bypasses asyncpg's statement cache, but it runs
+        # only here, not per execution.
+        stmt = await connection.prepare(fetch_sql, timeout=timeout)
+        attributes = stmt.get_attributes()
+        col_serializers = self._build_column_serializers(attributes) if attributes else None
+        cache[fetch_sql] = col_serializers
+        if len(cache) > _SERIALIZER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return col_serializers
+
+    def _evict_serializers(self, fetch_sql: str) -> None:
+        """Drop the cached dispatch list for a statement whose types changed."""
+        self._serializer_cache.pop(fetch_sql, None)
+        logger.warning(
+            "Evicted stale serializer dispatch list after column type change",
+            extra={"sql": fetch_sql[:200]},
+        )
+
+    def _serialize_results_guarded(
+        self,
+        records: Sequence[Any],
+        col_serializers: list[Callable[[Any], Any]] | None,
+        fetch_sql: str,
+    ) -> list[dict[str, Any]]:
+        """Serialize rows, recovering from a stale cached dispatch list.
+
+        After a schema change asyncpg transparently re-prepares the statement,
+        but the executor-level serializer cache cannot observe that, so a
+        cached converter may meet values of a new type and fail. The failure
+        evicts the cache entry and the affected rows fall back to the generic
+        per-cell cascade; the next execution rebuilds the dispatch list from
+        fresh metadata.
+
+        Args:
+            records: Sequence of asyncpg Records (or mappings) to serialize.
+            col_serializers: Cached per-column serializers, or None for the
+                generic path.
+            fetch_sql: Cache key to evict if the dispatch list is stale.
+
+        Returns:
+            list: Row dictionaries with all values serialized.
+        """
+        if col_serializers is None:
+            return self._serialize_results(records)
+        try:
+            return self._serialize_results(records, col_serializers)
+        except (AttributeError, TypeError, ValueError):
+            self._evict_serializers(fetch_sql)
+            return self._serialize_results(records)
+
+    def _columnar_results_guarded(
+        self,
+        records: Sequence[Any],
+        col_serializers: list[Callable[[Any], Any]] | None,
+        fetch_sql: str,
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Shape records as columns plus rows, recovering from stale caches.
+
+        Columnar counterpart of :meth:`_serialize_results_guarded`.
+
+        Args:
+            records: Sequence of asyncpg Records (or mappings) to serialize.
+            col_serializers: Cached per-column serializers, or None for the
+                generic path.
+            fetch_sql: Cache key to evict if the dispatch list is stale.
+
+        Returns:
+            tuple: (columns, rows)
+        """
+        if col_serializers is None:
+            return self._columnar_results(records)
+        try:
+            return self._columnar_results(records, col_serializers)
+        except (AttributeError, TypeError, ValueError):
+            self._evict_serializers(fetch_sql)
+            return self._columnar_results(records)
+
+    @staticmethod
+    def _wrap_with_limit(sql: str, max_rows: int) -> str:
+        """Wrap SQL in a subquery that limits rows server-side.
+
+        The limit is ``max_rows + 1`` so one sentinel row beyond the cap can
+        signal truncation without fetching the full result set.
+
+        Only SELECT and WITH statements are valid as a subquery; anything
+        else the validator may have allowed through (e.g. EXPLAIN when
+        ``allow_explain`` is set) is returned unchanged, which callers detect
+        by identity. A newline precedes the closing parenthesis so a trailing
+        line comment in the original statement cannot swallow the wrapper's
+        tail.
+
+        Args:
+            sql: Validated SQL query to wrap.
+            max_rows: Maximum number of rows the caller will receive.
 
-            # Serialize special PostgreSQL types
-            results = self._serialize_results(results)
+        Returns:
+            str: The wrapped query, or ``sql`` itself when it cannot be
+                wrapped.
 
-            return results, total_count
+        Example:
+            >>> SQLExecutor._wrap_with_limit("SELECT * FROM users;", 100)
+            'SELECT * FROM (SELECT * FROM users\\n) AS __pgmcp_sub LIMIT 101'
+        """
+        if _WRAPPABLE_SQL_RE.match(sql) is None:
+            return sql
+        inner = sql.strip().rstrip(";")
+        return f"SELECT * FROM ({inner}\n) AS __pgmcp_sub LIMIT {max_rows + 1}"  # noqa: S608
 
     async def _set_session_params(
         self,
@@ -237,6 +844,13 @@ class SQLExecutor:
         1. statement_timeout: Prevents long-running queries
         2. search_path: Prevents schema injection attacks
         3. SET ROLE: Switches to read-only role if configured
+        4. default_transaction_read_only: Keeps implicit per-statement
+           transactions read-only even when the pool was created without
+           the security config
+
+        When the executor was created with ``session_pinned=True``, the
+        static parameters (search_path, role) were already applied at pool
+        connection-setup time, so only the statement timeout is sent here.
 
         Args:
             conn: Database connection to configure.
@@ -250,46 +864,50 @@ class SQLExecutor:
             automatically reset when the connection is returned to the pool.
         """
         try:
-            # Set statement timeout (PostgreSQL expects milliseconds)
+            # Set statement timeout (PostgreSQL expects milliseconds). The
+            # static statements were validated and formatted once at
+            # construction time (None when the pool pins them); PostgreSQL's
+            # simple-query protocol accepts the multi-statement batch, so all
+            # parameters arrive in a single round-trip.
             timeout_ms = int(timeout * 1000)
-            await conn.execute(f"SET statement_timeout = {timeout_ms}")
-
-            # Set safe search_path to prevent schema injection
-            # Using execute with literal to avoid SQL injection
-            search_path = self.security_config.safe_search_path
-            # Validate search_path contains only safe characters
-            if not all(c.isalnum() or c in ("_", ",", " ") for c in search_path):
-                raise DatabaseError(
-                    message="Invalid search_path configuration",
-                    details={"search_path": search_path},
-                )
-            await conn.execute(f"SET search_path = '{search_path}'")
-
-            # Switch to read-only role if configured
-            if self.security_config.readonly_role:
-                readonly_role = self.security_config.readonly_role
-                # Validate role name contains only safe characters
-                if not all(c.isalnum() or c == "_" for c in readonly_role):
-                    raise DatabaseError(
-                        message="Invalid readonly_role configuration",
-                        details={"readonly_role": readonly_role},
-                    )
-                await conn.execute(f"SET ROLE {readonly_role}")
+            session_sql = self._timeout_stmt_cache.get(timeout_ms)
+            if session_sql is None:
+                # Memoize the full batch per timeout: in practice only a
+                # handful of timeout values occur (the configured default plus
+                # occasional overrides), so formatting happens once each
+                session_sql = f"SET statement_timeout = {timeout_ms}"
+                if self._static_session_sql is not None:
+                    session_sql = f"{session_sql}; {self._static_session_sql}"
+                self._timeout_stmt_cache[timeout_ms] = session_sql
+            await conn.execute(session_sql)
 
         except asyncpg.PostgresError as e:
             raise DatabaseError(
                 message=f"Failed to set session parameters: {e!s}",
                 details={
-                    "error_code": e.sqlstate if hasattr(e, "sqlstate") else None,
+                    "error_code": e.sqlstate,
                     "timeout_ms": timeout_ms,
                     "search_path": self.security_config.safe_search_path,
                     "readonly_role": self.security_config.readonly_role,
                 },
             ) from e
 
-    def _serialize_results(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _serialize_results(
+        self,
+        records: Sequence[Any],
+        col_serializers: list[Callable[[Any], Any]] | None = None,
+    ) -> list[dict[str, Any]]:
         """Serialize PostgreSQL-specific types to JSON-compatible types.
 
+        Rows are built directly from the records in a single fused pass: the
+        column keys are read once from the first record and each row dict is
+        emitted already serialized, avoiding the intermediate ``dict(record)``
+        allocation per row.
+
+        When per-column serializers are supplied (built from the prepared
+        statement's type metadata), each cell is converted with a single flat
+        call instead of the generic isinstance cascade.
+
         This method handles serialization of types that are not natively
         JSON-serializable, including:
         - datetime types: converted to ISO format strings
@@ -299,64 +917,144 @@ class SQLExecutor:
         - Nested lists/dicts: recursively serialized
 
         Args:
-            results: List of row dictionaries with potentially unserializable values.
+            records: Sequence of asyncpg Records (or mappings) to serialize.
+            col_serializers: Optional per-column serializer functions from
+                :meth:`_build_column_serializers`.
 
         Returns:
-            list: Results with all values serialized to JSON-compatible types.
+            list: Row dictionaries with all values serialized to
+                JSON-compatible types.
 
         Example:
-            >>> results = [
+            >>> records = [
             ...     {"id": 1, "created": datetime.datetime(2024, 1, 1, 12, 0)},
             ...     {"id": 2, "price": decimal.Decimal("99.99")}
             ... ]
-            >>> serialized = executor._serialize_results(results)
+            >>> serialized = executor._serialize_results(records)
             >>> serialized[0]["created"]  # "2024-01-01T12:00:00"
             >>> serialized[1]["price"]  # 99.99
         """
+        if not records:
+            return []
+
+        # Column keys are identical for every row of a result set
+        keys = list(records[0].keys())
+        return _serialize_rows(records, keys, col_serializers)
+
+    @staticmethod
+    def _columnar_results(
+        records: Sequence[Any],
+        col_serializers: list[Callable[[Any], Any]] | None = None,
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Shape records as column names plus serialized row arrays.
+
+        Unlike :meth:`_serialize_results`, each row is a plain list of values
+        — one allocation per row with no repeated string keys.
+
+        Args:
+            records: Sequence of asyncpg Records (or mappings) to serialize.
+            col_serializers: Optional per-column serializer functions from
+                :meth:`_build_column_serializers`.
+
+        Returns:
+            tuple: (columns, rows)
+        """
+        if not records:
+            return [], []
+
+        keys = list(records[0].keys())
+        return keys, _columnar_rows(records, col_serializers)
+
+    def _build_column_serializers(
+        self,
+        attributes: Sequence[Any],
+    ) -> list[Callable[[Any], Any]]:
+        """Build one serializer function per column from statement metadata.
+
+        Instead of running the generic isinstance cascade for every cell, the
+        column's PostgreSQL type (from the prepared statement's attributes)
+        selects a flat conversion function once per query. Columns that are
+        already JSON-native get an identity function; json/jsonb, arrays, and
+        unknown types fall back to the recursive generic serializer. The
+        per-instance table reflects the configured ``encoder_mode``.
+
+        Args:
+            attributes: Attributes from ``PreparedStatement.get_attributes()``.
+
+        Returns:
+            list: One callable per column, aligned with the column order.
+        """
+        serializers: list[Callable[[Any], Any]] = []
+        table = self._column_serializers
+        for attr in attributes:
+            type_name = attr.type.name
+            if type_name in _JSON_NATIVE_TYPES:
+                serializers.append(_identity)
+            else:
+                serializers.append(table.get(type_name, _serialize_value))
+        return serializers
 
-        def serialize_value(value: Any) -> Any:
-            """Recursively serialize a single value.
 
-            Args:
-                value: Value to serialize.
+class ExecutorSession:
+    """Query handle bound to a single held pool connection.
 
-            Returns:
-                Serialized value that is JSON-compatible.
-            """
-            # Handle None
-            if value is None:
-                return None
+    Created by :meth:`SQLExecutor.session`; all queries issued through it
+    reuse the same connection, skipping the per-call pool acquire/release.
 
-            # Handle datetime types
-            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
-                return value.isoformat()
+    Example:
+        >>> async with executor.session() as s:
+        ...     results, count = await s.execute("SELECT * FROM users")
+    """
 
-            # Handle timedelta
-            if isinstance(value, datetime.timedelta):
-                return str(value)
+    def __init__(self, executor: SQLExecutor, connection: Connection) -> None:
+        """Initialize session handle.
 
-            # Handle Decimal (convert to float)
-            if isinstance(value, decimal.Decimal):
-                return float(value)
+        Args:
+            executor: The executor whose configuration and query logic apply.
+            connection: The held connection all queries run on.
+        """
+        self._executor = executor
+        self._connection = connection
+
+    async def execute(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+        max_rows: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Execute SQL on the held connection.
 
-            # Handle UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
+        Applies the same security measures as :meth:`SQLExecutor.execute`
+        (session parameters, row limiting, serialization) but without the
+        retry loop, since a transient failure usually invalidates the held
+        connection.
 
-            # Handle bytes (convert to hex string)
-            if isinstance(value, bytes):
-                return value.hex()
+        Args:
+            sql: SQL query to execute (should already be validated).
+            timeout: Query timeout in seconds (uses config default if None).
+            max_rows: Maximum rows to return (uses config default if None).
 
-            # Handle lists and tuples (recursively serialize)
-            if isinstance(value, (list, tuple)):
-                return [serialize_value(v) for v in value]
+        Returns:
+            tuple: (results, total_row_count)
 
-            # Handle dicts (recursively serialize values)
-            if isinstance(value, dict):
-                return {k: serialize_value(v) for k, v in value.items()}
+        Raises:
+            ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseError: If the query fails.
+        """
+        executor = self._executor
+        timeout = timeout or executor.security_config.max_execution_time
+        max_rows = max_rows or executor.security_config.max_rows
 
-            # Return other types as-is (str, int, float, bool, etc.)
-            return value
+        push_limit = executor.security_config.push_limit_into_sql
+        fetch_sql = executor._wrap_with_limit(sql, max_rows) if push_limit else sql
 
-        # Serialize all values in all rows
-        return [{key: serialize_value(value) for key, value in row.items()} for row in results]
+        try:
+            return await executor._run_query(self._connection, sql, fetch_sql, timeout, max_rows)
+        except asyncpg.PostgresError as e:
+            raise DatabaseError(
+                message=f"Database query failed: {e!s}",
+                details={
+                    "error_code": e.sqlstate,
+                    "sql": sql[:200],
+                },
+            ) from e
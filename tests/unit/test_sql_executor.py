@@ -4,7 +4,6 @@ This module tests the SQL execution functionality including session parameter
 configuration, result serialization, row limiting, and error handling.
 """
 
-import asyncio
 import datetime
 import decimal
 import uuid
@@ -14,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock
 import asyncpg
 import pytest
 
-from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.config.settings import DatabaseConfig, ResilienceConfig, SecurityConfig
 from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
 from pg_mcp.services.sql_executor import SQLExecutor
 
@@ -38,6 +37,20 @@ def create_mock_record(data: dict[str, Any]) -> MagicMock:
     return mock_record
 
 
+def create_mock_attr(type_name: str) -> MagicMock:
+    """Create a mock statement attribute mimicking asyncpg's Attribute shape.
+
+    Args:
+        type_name: PostgreSQL type name for the column.
+
+    Returns:
+        MagicMock whose ``type.name`` matches the given type.
+    """
+    attr = MagicMock()
+    attr.type.name = type_name
+    return attr
+
+
 @pytest.fixture
 def security_config() -> SecurityConfig:
     """Create a default security configuration for testing."""
@@ -78,6 +91,14 @@ def mock_connection() -> MagicMock:
     conn = MagicMock()
     conn.execute = AsyncMock()
     conn.fetch = AsyncMock()
+    conn.fetchval = AsyncMock()
+
+    # The executor fetches through conn.fetch (asyncpg's statement-cache path)
+    # and describes the statement via conn.prepare only on a serializer-cache
+    # miss to read its column type metadata
+    stmt = MagicMock()
+    stmt.get_attributes = MagicMock(return_value=())  # no type metadata: generic path
+    conn.prepare = AsyncMock(return_value=stmt)
 
     # Setup transaction context manager
     transaction_mock = MagicMock()
@@ -147,9 +168,15 @@ class TestSQLExecutor:
         assert results[1]["id"] == 2
         assert results[1]["name"] == "Bob"
 
-        # Verify session parameters were set
-        assert mock_connection.execute.call_count >= 2  # timeout and search_path
-        mock_connection.fetch.assert_called_once_with(sql)
+        # Verify session parameters were set in a single batched statement
+        assert mock_connection.execute.call_count == 1
+        session_sql = str(mock_connection.execute.call_args[0][0])
+        assert "statement_timeout" in session_sql
+        assert "search_path" in session_sql
+        # The executor pushes the row limit into the fetched SQL
+        fetched_sql = mock_connection.fetch.call_args[0][0]
+        assert sql in fetched_sql
+        assert "LIMIT" in fetched_sql
 
     @pytest.mark.asyncio
     async def test_execute_with_custom_timeout_and_max_rows(
@@ -190,11 +217,8 @@ class TestSQLExecutor:
         # Arrange
         sql = "SELECT * FROM slow_query"
 
-        # Simulate timeout
-        async def slow_fetch(*args: Any, **kwargs: Any) -> None:
-            await asyncio.sleep(10)
-
-        mock_connection.fetch = slow_fetch
+        # asyncpg's native fetch(timeout=...) surfaces as a builtin TimeoutError
+        mock_connection.fetch.side_effect = TimeoutError()
 
         # Act & Assert
         with pytest.raises(ExecutionTimeoutError) as exc_info:
@@ -283,20 +307,77 @@ class TestSQLExecutor:
         assert any("SET ROLE readonly_user" in cmd for cmd in execute_commands)
 
     @pytest.mark.asyncio
-    async def test_session_params_invalid_search_path(
+    async def test_no_explicit_transaction_by_default(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that queries rely on the session's read-only default mode."""
+        # Arrange
+        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+
+        # Act
+        await executor.execute("SELECT 1")
+
+        # Assert - no BEGIN/COMMIT round-trips
+        mock_connection.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_readonly_default_enforced_without_pinned_pool(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that a non-pinned executor sets the read-only session default."""
+        # Arrange
+        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+
+        # Act
+        await executor.execute("SELECT 1")
+
+        # Assert - the session batch keeps implicit transactions read-only
+        session_sql = str(mock_connection.execute.call_args[0][0])
+        assert "SET default_transaction_read_only = on" in session_sql
+
+    @pytest.mark.asyncio
+    async def test_explicit_transaction_when_configured(
         self,
         mock_connection: MagicMock,
         db_config: DatabaseConfig,
     ) -> None:
-        """Test that invalid search_path is rejected."""
+        """Test that explicit_transaction opens a read-only transaction."""
         # Arrange
-        malicious_config = SecurityConfig(
+        config = SecurityConfig(
             max_execution_time=30.0,
             max_rows=10000,
-            safe_search_path="public; DROP TABLE users;--",  # SQL injection attempt
+            safe_search_path="public",
             readonly_role=None,
+            explicit_transaction=True,
         )
-        # Create a new pool with the mock connection
+        pool = MagicMock()
+        acquire_mock = MagicMock()
+        acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
+        acquire_mock.__aexit__ = AsyncMock(return_value=None)
+        pool.acquire = MagicMock(return_value=acquire_mock)
+
+        executor = SQLExecutor(pool=pool, security_config=config, db_config=db_config)
+        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+
+        # Act
+        await executor.execute("SELECT 1")
+
+        # Assert
+        mock_connection.transaction.assert_called_once_with(readonly=True)
+
+    @pytest.mark.asyncio
+    async def test_session_params_pinned(
+        self,
+        mock_connection: MagicMock,
+        security_config_with_role: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that pinned sessions only set the statement timeout per query."""
+        # Arrange
         pool = MagicMock()
         acquire_mock = MagicMock()
         acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
@@ -305,14 +386,51 @@ class TestSQLExecutor:
 
         executor = SQLExecutor(
             pool=pool,
-            security_config=malicious_config,
+            security_config=security_config_with_role,
             db_config=db_config,
+            session_pinned=True,
         )
         sql = "SELECT 1"
+        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
 
-        # Act & Assert
+        # Act
+        await executor.execute(sql, timeout=15.0)
+
+        # Assert - search_path and role are pinned by the pool, not re-sent
+        execute_commands = [str(call[0][0]) for call in mock_connection.execute.call_args_list]
+        assert any("SET statement_timeout = 15000" in cmd for cmd in execute_commands)
+        assert not any("search_path" in cmd for cmd in execute_commands)
+        assert not any("SET ROLE" in cmd for cmd in execute_commands)
+        assert not any("default_transaction_read_only" in cmd for cmd in execute_commands)
+
+    @pytest.mark.asyncio
+    async def test_session_params_invalid_search_path(
+        self,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that invalid search_path is rejected at construction."""
+        # Arrange
+        malicious_config = SecurityConfig(
+            max_execution_time=30.0,
+            max_rows=10000,
+            safe_search_path="public; DROP TABLE users;--",  # SQL injection attempt
+            readonly_role=None,
+        )
+        # Create a new pool with the mock connection
+        pool = MagicMock()
+        acquire_mock = MagicMock()
+        acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
+        acquire_mock.__aexit__ = AsyncMock(return_value=None)
+        pool.acquire = MagicMock(return_value=acquire_mock)
+
+        # Act & Assert - misconfiguration surfaces when the executor is built
         with pytest.raises(DatabaseError) as exc_info:
-            await executor.execute(sql)
+            SQLExecutor(
+                pool=pool,
+                security_config=malicious_config,
+                db_config=db_config,
+            )
 
         assert "invalid search_path" in str(exc_info.value.message).lower()
 
@@ -322,7 +440,7 @@ class TestSQLExecutor:
         mock_connection: MagicMock,
         db_config: DatabaseConfig,
     ) -> None:
-        """Test that invalid role name is rejected."""
+        """Test that invalid role name is rejected at construction."""
         # Arrange
         malicious_config = SecurityConfig(
             max_execution_time=30.0,
@@ -337,18 +455,183 @@ class TestSQLExecutor:
         acquire_mock.__aexit__ = AsyncMock(return_value=None)
         pool.acquire = MagicMock(return_value=acquire_mock)
 
+        # Act & Assert - misconfiguration surfaces when the executor is built
+        with pytest.raises(DatabaseError) as exc_info:
+            SQLExecutor(
+                pool=pool,
+                security_config=malicious_config,
+                db_config=db_config,
+            )
+
+        assert "invalid readonly_role" in str(exc_info.value.message).lower()
+
+    @pytest.mark.asyncio
+    async def test_serialization_offloaded_above_threshold(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that large result sets serialize through a worker thread."""
+        # Arrange - threshold of 0 forces every result through to_thread
         executor = SQLExecutor(
-            pool=pool,
-            security_config=malicious_config,
+            pool=mock_pool,
+            security_config=security_config,
             db_config=db_config,
+            serialize_in_thread_threshold=0,
         )
-        sql = "SELECT 1"
+        mock_connection.fetch.return_value = [create_mock_record({"id": i}) for i in range(5)]
 
-        # Act & Assert
-        with pytest.raises(DatabaseError) as exc_info:
-            await executor.execute(sql)
+        # Act
+        results, count = await executor.execute("SELECT id FROM users")
 
-        assert "invalid readonly_role" in str(exc_info.value.message).lower()
+        # Assert - results identical to the inline path
+        assert count == 5
+        assert results == [{"id": i} for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_connection_released_before_serialization(
+        self,
+        executor: SQLExecutor,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that serialization runs after the connection is released."""
+        # Arrange
+        mock_connection.fetch.return_value = [create_mock_record({"id": 1})]
+        acquire_cm = mock_pool.acquire.return_value
+        release_counts: list[int] = []
+        original = executor._serialize_results
+
+        def spy(records: Any, col_serializers: Any = None) -> Any:
+            release_counts.append(acquire_cm.__aexit__.await_count)
+            return original(records, col_serializers)
+
+        monkeypatch.setattr(executor, "_serialize_results", spy)
+
+        # Act
+        await executor.execute("SELECT id FROM users")
+
+        # Assert - the acquire context had already exited when serializing
+        assert release_counts == [1]
+
+
+class TestColumnarExecution:
+    """Test suite for the columnar result shape."""
+
+    @pytest.mark.asyncio
+    async def test_execute_columnar_basic(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test executing a query with columnar output."""
+        # Arrange
+        mock_records = [
+            create_mock_record({"id": 1, "name": "Alice"}),
+            create_mock_record({"id": 2, "name": "Bob"}),
+        ]
+        mock_connection.fetch.return_value = mock_records
+
+        # Act
+        columns, rows, count = await executor.execute_columnar("SELECT id, name FROM users")
+
+        # Assert
+        assert columns == ["id", "name"]
+        assert rows == [[1, "Alice"], [2, "Bob"]]
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_columnar_empty(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test columnar output for an empty result set."""
+        # Arrange
+        mock_connection.fetch.return_value = []
+
+        # Act
+        columns, rows, count = await executor.execute_columnar("SELECT id FROM users")
+
+        # Assert
+        assert columns == []
+        assert rows == []
+        assert count == 0
+
+    def test_columnar_results_serializes_values(self) -> None:
+        """Test that columnar shaping serializes special types."""
+        # Arrange
+        records = [{"id": 1, "created": datetime.datetime(2024, 1, 1, 12, 0)}]
+
+        # Act
+        columns, rows = SQLExecutor._columnar_results(records)
+
+        # Assert
+        assert columns == ["id", "created"]
+        assert rows == [[1, "2024-01-01T12:00:00"]]
+
+
+class TestExecutorSession:
+    """Test suite for the shared-connection session."""
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_single_connection(
+        self,
+        executor: SQLExecutor,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that sequential queries share one pool acquisition."""
+        # Arrange
+        mock_connection.fetch.return_value = [create_mock_record({"id": 1})]
+
+        # Act
+        async with executor.session() as session:
+            results_first, _ = await session.execute("SELECT * FROM users")
+            results_second, _ = await session.execute("SELECT * FROM orders")
+
+        # Assert - one acquire, both statements fetched on the same connection
+        mock_pool.acquire.assert_called_once()
+        assert mock_connection.fetch.call_count == 2
+        assert results_first[0]["id"] == 1
+        assert results_second[0]["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_applies_row_limit(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that session queries still enforce max_rows."""
+        # Arrange
+        mock_records = [create_mock_record({"id": i}) for i in range(20)]
+        mock_connection.fetch.return_value = mock_records
+
+        # Act
+        async with executor.session() as session:
+            results, count = await session.execute("SELECT * FROM users", max_rows=5)
+
+        # Assert
+        assert len(results) == 5
+        assert count == 20
+
+    @pytest.mark.asyncio
+    async def test_session_wraps_database_errors(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that session queries raise DatabaseError like other paths."""
+        # Arrange
+        mock_connection.fetch.side_effect = asyncpg.PostgresSyntaxError("syntax error")
+
+        # Act & Assert
+        async with executor.session() as session:
+            with pytest.raises(DatabaseError):
+                await session.execute("SELEC * FROM users")
 
 
 class TestResultSerialization:
@@ -524,6 +807,242 @@ class TestResultSerialization:
         assert serialized[0]["nullable_date"] is None
         assert serialized[0]["nullable_decimal"] is None
 
+    def test_build_column_serializers_dispatch(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test that column serializers are selected from type metadata."""
+        # Arrange
+        attributes = [
+            create_mock_attr("int4"),
+            create_mock_attr("timestamptz"),
+            create_mock_attr("numeric"),
+            create_mock_attr("jsonb"),
+        ]
+
+        # Act
+        serializers = executor_for_serialization._build_column_serializers(attributes)
+
+        # Assert - native column is identity, typed columns convert, jsonb recurses
+        assert serializers[0](42) == 42
+        assert serializers[1](datetime.datetime(2024, 1, 1, 12, 0)) == "2024-01-01T12:00:00"
+        assert serializers[1](None) is None
+        assert serializers[2](decimal.Decimal("99.99")) == 99.99
+        assert serializers[3]({"ts": datetime.date(2024, 1, 1)}) == {"ts": "2024-01-01"}
+
+    def test_serialize_with_column_serializers(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test serialization using per-column dispatch."""
+        # Arrange
+        records = [
+            {"id": 1, "created": datetime.datetime(2024, 1, 1, 12, 0)},
+            {"id": 2, "created": None},
+        ]
+
+        serializers = executor_for_serialization._build_column_serializers(
+            [create_mock_attr("int4"), create_mock_attr("timestamptz")]
+        )
+
+        # Act
+        serialized = executor_for_serialization._serialize_results(records, serializers)
+
+        # Assert
+        assert serialized[0] == {"id": 1, "created": "2024-01-01T12:00:00"}
+        assert serialized[1] == {"id": 2, "created": None}
+
+    def test_serialize_all_native_columns_fast_path(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test that all-identity serializers return rows without conversion."""
+        # Arrange
+        records = [{"id": 1, "name": "Alice", "active": True}]
+
+        serializers = executor_for_serialization._build_column_serializers(
+            [create_mock_attr("int4"), create_mock_attr("text"), create_mock_attr("bool")]
+        )
+
+        # Act
+        serialized = executor_for_serialization._serialize_results(records, serializers)
+
+        # Assert
+        assert serialized == [{"id": 1, "name": "Alice", "active": True}]
+
+    def test_encoder_mode_passthrough(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that C encoder modes pass datetime/UUID columns through."""
+        # Arrange - pretend orjson is installed
+        import pg_mcp.services.sql_executor as sql_executor_module
+
+        monkeypatch.setattr(sql_executor_module, "_HAS_ORJSON", True)
+        executor = SQLExecutor(
+            pool=mock_pool,
+            security_config=security_config,
+            db_config=db_config,
+            encoder_mode="orjson",
+        )
+
+        # Act
+        serializers = executor._build_column_serializers(
+            [create_mock_attr("timestamptz"), create_mock_attr("uuid"), create_mock_attr("numeric")]
+        )
+
+        # Assert - datetime/UUID untouched, Decimal still converted
+        moment = datetime.datetime(2024, 1, 1, 12, 0)
+        assert serializers[0](moment) is moment
+        test_uuid = uuid.uuid4()
+        assert serializers[1](test_uuid) is test_uuid
+        assert serializers[2](decimal.Decimal("1.5")) == 1.5
+
+    def test_encoder_mode_requires_library(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a missing encoder library is rejected at construction."""
+        # Arrange
+        import pg_mcp.services.sql_executor as sql_executor_module
+
+        monkeypatch.setattr(sql_executor_module, "_HAS_ORJSON", False)
+
+        # Act & Assert
+        with pytest.raises(DatabaseError) as exc_info:
+            SQLExecutor(
+                pool=mock_pool,
+                security_config=security_config,
+                db_config=db_config,
+                encoder_mode="orjson",
+            )
+
+        assert "orjson" in str(exc_info.value.message)
+
+    def test_uuid_hex_format(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that uuid_format='hex' emits dashless hex strings."""
+        # Arrange
+        executor = SQLExecutor(
+            pool=mock_pool,
+            security_config=security_config,
+            db_config=db_config,
+            uuid_format="hex",
+        )
+        serializers = executor._build_column_serializers([create_mock_attr("uuid")])
+
+        # Act
+        test_uuid = uuid.UUID("550e8400-e29b-41d4-a716-446655440000")
+        result = serializers[0](test_uuid)
+
+        # Assert - dashless 32-character form, None passes through
+        assert result == "550e8400e29b41d4a716446655440000"
+        assert serializers[0](None) is None
+
+    @pytest.mark.parametrize(
+        "bytes_encoding,expected",
+        [
+            ("hex", "010203"),
+            ("base64", "AQID"),
+            ("raw", b"\x01\x02\x03"),
+        ],
+    )
+    def test_bytes_encoding_modes(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+        bytes_encoding: str,
+        expected: Any,
+    ) -> None:
+        """Test the configurable bytea column encodings."""
+        # Arrange
+        executor = SQLExecutor(
+            pool=mock_pool,
+            security_config=security_config,
+            db_config=db_config,
+            bytes_encoding=bytes_encoding,  # type: ignore[arg-type]
+        )
+        serializers = executor._build_column_serializers([create_mock_attr("bytea")])
+
+        # Act & Assert
+        assert serializers[0](b"\x01\x02\x03") == expected
+        assert serializers[0](None) is None
+
+    @pytest.mark.asyncio
+    async def test_serializer_dispatch_cached_across_executions(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the dispatch list is built once while types are stable."""
+        # Arrange
+        mock_connection.fetch.return_value = [create_mock_record({"id": 1})]
+        stmt = mock_connection.prepare.return_value
+        stmt.get_attributes = MagicMock(return_value=[create_mock_attr("int4")])
+
+        build_calls: list[int] = []
+        original = executor._build_column_serializers
+
+        def spy(attributes: Any) -> Any:
+            build_calls.append(1)
+            return original(attributes)
+
+        monkeypatch.setattr(executor, "_build_column_serializers", spy)
+
+        # Act - same statement executed twice
+        await executor.execute("SELECT id FROM users")
+        await executor.execute("SELECT id FROM users")
+
+        # Assert - the dispatch list was built only on the first execution,
+        # and the statement was only described once: the fetches themselves
+        # go through asyncpg's per-connection statement cache
+        assert len(build_calls) == 1
+        assert mock_connection.prepare.call_count == 1
+        assert mock_connection.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_serializer_cache_invalidated_on_type_change(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that a schema change evicts the stale dispatch list."""
+        # Arrange - first execution sees a timestamp column
+        stmt = mock_connection.prepare.return_value
+        stmt.get_attributes = MagicMock(return_value=[create_mock_attr("timestamp")])
+        moment = datetime.datetime(2024, 1, 1, 12, 0)
+        mock_connection.fetch.return_value = [create_mock_record({"created": moment})]
+
+        results, _ = await executor.execute("SELECT created FROM events")
+        assert results[0]["created"] == "2024-01-01T12:00:00"
+
+        # Act - the column becomes text (ALTER TABLE ... TYPE): the cached
+        # timestamp converter fails on the new values, which evicts the entry
+        # and falls back to the generic path for the affected rows
+        stmt.get_attributes = MagicMock(return_value=[create_mock_attr("text")])
+        mock_connection.fetch.return_value = [create_mock_record({"created": "2024-01-01"})]
+
+        results, _ = await executor.execute("SELECT created FROM events")
+        assert results[0]["created"] == "2024-01-01"
+
+        # Assert - the next execution re-describes the statement and caches a
+        # dispatch list built from the new metadata
+        results, _ = await executor.execute("SELECT created FROM events")
+        assert results[0]["created"] == "2024-01-01"
+        assert mock_connection.prepare.call_count == 2
+
     def test_serialize_mixed_types(
         self,
         executor_for_serialization: SQLExecutor,
@@ -614,3 +1133,175 @@ class TestRowLimiting:
         # Assert
         assert count == 10
         assert len(results) == 10  # All results returned
+
+    def test_wrap_with_limit(self) -> None:
+        """Test that SQL is wrapped in a LIMIT subquery with a sentinel row."""
+        wrapped = SQLExecutor._wrap_with_limit("SELECT * FROM users;", 100)
+
+        assert wrapped == "SELECT * FROM (SELECT * FROM users\n) AS __pgmcp_sub LIMIT 101"
+
+    def test_wrap_with_limit_trailing_comment(self) -> None:
+        """Test that a trailing line comment cannot swallow the wrapper tail."""
+        wrapped = SQLExecutor._wrap_with_limit("SELECT id FROM users -- latest batch", 100)
+
+        # The closing paren must land on its own line, outside the comment
+        assert wrapped.endswith("\n) AS __pgmcp_sub LIMIT 101")
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "EXPLAIN SELECT * FROM users",
+            "EXPLAIN ANALYZE SELECT * FROM users",
+        ],
+    )
+    def test_wrap_with_limit_explain_passthrough(self, sql: str) -> None:
+        """Test that non-wrappable statements pass through unchanged."""
+        assert SQLExecutor._wrap_with_limit(sql, 100) is sql
+
+    def test_wrap_with_limit_cte(self) -> None:
+        """Test that WITH queries are recognized as wrappable."""
+        wrapped = SQLExecutor._wrap_with_limit("WITH cte AS (SELECT 1) SELECT * FROM cte", 10)
+
+        assert wrapped.startswith("SELECT * FROM (WITH cte")
+
+    @pytest.mark.asyncio
+    async def test_limit_pushdown_disabled(
+        self,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that the raw SQL is executed when pushdown is disabled."""
+        # Arrange
+        config = SecurityConfig(
+            max_execution_time=30.0,
+            max_rows=10000,
+            safe_search_path="public",
+            readonly_role=None,
+            push_limit_into_sql=False,
+        )
+        pool = MagicMock()
+        acquire_mock = MagicMock()
+        acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
+        acquire_mock.__aexit__ = AsyncMock(return_value=None)
+        pool.acquire = MagicMock(return_value=acquire_mock)
+
+        executor = SQLExecutor(pool=pool, security_config=config, db_config=db_config)
+        sql = "SELECT id FROM users"
+        mock_connection.fetch.return_value = [create_mock_record({"id": 1})]
+
+        # Act
+        await executor.execute(sql)
+
+        # Assert - SQL passed through unwrapped
+        mock_connection.fetch.assert_called_once_with(sql, timeout=30.0)
+
+    @pytest.mark.asyncio
+    async def test_exact_total_count_on_truncation(
+        self,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a COUNT(*) subquery is issued when configured."""
+        # Arrange
+        config = SecurityConfig(
+            max_execution_time=30.0,
+            max_rows=10000,
+            safe_search_path="public",
+            readonly_role=None,
+            count_total_rows=True,
+        )
+        pool = MagicMock()
+        acquire_mock = MagicMock()
+        acquire_mock.__aenter__ = AsyncMock(return_value=mock_connection)
+        acquire_mock.__aexit__ = AsyncMock(return_value=None)
+        pool.acquire = MagicMock(return_value=acquire_mock)
+
+        executor = SQLExecutor(pool=pool, security_config=config, db_config=db_config)
+        sql = "SELECT id FROM big_table"
+        mock_records = [create_mock_record({"id": i}) for i in range(11)]
+        mock_connection.fetch.return_value = mock_records
+        mock_connection.fetchval.return_value = 5000
+
+        # Act
+        results, count = await executor.execute(sql, max_rows=10)
+
+        # Assert
+        assert len(results) == 10
+        assert count == 5000
+        count_sql = mock_connection.fetchval.call_args[0][0]
+        assert count_sql.startswith("SELECT count(*)")
+
+
+class TestRetryBehavior:
+    """Test suite for transient-error retry with jittered backoff."""
+
+    @pytest.fixture
+    def retry_executor(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> SQLExecutor:
+        """Create an executor with a fast retry configuration."""
+        return SQLExecutor(
+            pool=mock_pool,
+            security_config=security_config,
+            db_config=db_config,
+            resilience_config=ResilienceConfig(
+                max_retries=2,
+                retry_delay=0.1,
+                backoff_factor=2.0,
+                retry_cap=1.0,
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_error(
+        self,
+        retry_executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that a retryable error (40001) is retried and then succeeds."""
+        # Arrange - first attempt fails with a serialization failure
+        mock_connection.fetch.side_effect = [
+            asyncpg.SerializationError("could not serialize access"),
+            [create_mock_record({"id": 1})],
+        ]
+
+        # Act
+        results, count = await retry_executor.execute("SELECT id FROM users")
+
+        # Assert
+        assert results == [{"id": 1}]
+        assert count == 1
+        assert mock_connection.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_fails_fast(
+        self,
+        retry_executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that a non-retryable error is not retried."""
+        # Arrange
+        mock_connection.fetch.side_effect = asyncpg.PostgresSyntaxError("syntax error")
+
+        # Act & Assert
+        with pytest.raises(DatabaseError):
+            await retry_executor.execute("SELEC id FROM users")
+        assert mock_connection.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(
+        self,
+        retry_executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that retries stop after max_retries attempts."""
+        # Arrange - every attempt fails with a retryable error
+        mock_connection.fetch.side_effect = asyncpg.SerializationError("could not serialize access")
+
+        # Act & Assert
+        with pytest.raises(DatabaseError):
+            await retry_executor.execute("SELECT id FROM users")
+        assert mock_connection.fetch.call_count == 3  # initial + 2 retries